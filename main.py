@@ -1,18 +1,20 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from cachetools import TTLCache
 from datetime import datetime
+import aiofiles
+import asyncio
 import logging
+import orjson
 import os
 
-from scraper import JobScraper
-
 # Configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Public Health Job Scraper", version="1.0.0")
+app = FastAPI(title="Public Health Job Scraper", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS
 app.add_middleware(
@@ -25,12 +27,47 @@ app.add_middleware(
 
 templates = Jinja2Templates(directory="templates")
 
+# Recent scrape results per search term, reused for 10 minutes (the cached
+# Job objects are shared across requests and enhanced in place by merge_jobs)
+scrape_cache = TTLCache(maxsize=512, ttl=600)
+
+async def scrape_term(scraper, term):
+    """Scrape a single search term, reusing recent results"""
+    key = term.lower().strip()
+    if key in scrape_cache:
+        return scrape_cache[key]
+    
+    jobs = await scraper.scrape_linkedin_jobs(term, 12)
+    
+    # Don't cache empty results so a failed scrape is retried next time
+    if jobs:
+        scrape_cache[key] = jobs
+    return jobs
+
+# Static files don't change at runtime, so each is read once and cached
+# (set DEV=1 to re-read on every request while editing)
+static_cache = {}
+
+async def read_static(path):
+    """Return the contents of a static file, reading it from disk only once"""
+    if path not in static_cache or os.getenv("DEV"):
+        async with aiofiles.open(path, "r") as f:
+            static_cache[path] = await f.read()
+    return static_cache[path]
+
+@app.on_event("startup")
+async def load_static_files():
+    for path in ["static/script.js", "static/style.css"]:
+        try:
+            await read_static(path)
+        except Exception as e:
+            logger.error(f"Failed to preload {path}: {e}")
+
 # Serve JavaScript via route instead of StaticFiles
 @app.get("/static/script.js")
 async def get_script():
     try:
-        with open("static/script.js", "r") as f:
-            content = f.read()
+        content = await read_static("static/script.js")
         return Response(content=content, media_type="application/javascript")
     except Exception as e:
         logger.error(f"Failed to load script.js: {e}")
@@ -50,8 +87,7 @@ async def get_script():
 @app.get("/static/style.css")  
 async def get_style():
     try:
-        with open("static/style.css", "r") as f:
-            content = f.read()
+        content = await read_static("static/style.css")
         return Response(content=content, media_type="text/css")
     except Exception as e:
         logger.error(f"Failed to load style.css: {e}")
@@ -65,10 +101,18 @@ async def read_root(request: Request):
 @app.get("/jobs/json")
 async def get_jobs_json():
     try:
-        scraper = JobScraper()
-        jobs = scraper.search_jobs(["public health", "epidemiology", "health policy"], 15)
+        # Imported here so httpx/lxml/selectolax/pyahocorasick/BeautifulSoup
+        # don't slow down cold starts
+        # (Python caches the module after the first call)
+        from scraper import JobScraper
+        
+        terms = ["public health", "epidemiology", "health policy"]
+        async with JobScraper() as scraper:
+            results = await asyncio.gather(*(scrape_term(scraper, term) for term in terms))
+        jobs = scraper.merge_jobs((job for term_jobs in results for job in term_jobs), 15)
         logger.info(f"✅ Returning {len(jobs)} jobs to frontend")
-        return jobs
+        # Serialize in one shot rather than via FastAPI's jsonable_encoder + json
+        return Response(content=orjson.dumps(jobs), media_type="application/json")
     except Exception as e:
         logger.error(f"❌ Error in jobs endpoint: {e}")
         return {"error": "Failed to fetch jobs", "details": str(e)}
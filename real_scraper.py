@@ -1,32 +1,81 @@
-import requests
+import asyncio
+import httpx
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
-import time
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import urlparse
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 import re
-import random
 
 logger = logging.getLogger(__name__)
 
+# Class-name patterns used when locating job listing elements
+_RE_JOBITEM = re.compile(r'job|listing|item', re.I)
+_RE_JOBVAC = re.compile(r'job|vacancy', re.I)
+
+# CSS selectors for the fields of a ReliefWeb listing, one tree walk per field
+_SEL_TITLE = 'h3, h4, a[class*=title i], a[class*=heading i]'
+_SEL_ORG = ':is(span, div):is([class*=org i], [class*=agency i], [class*=source i])'
+_SEL_LOC = ':is(span, div):is([class*=country i], [class*=location i], [class*=place i])'
+_SEL_DATE = ':is(time, span):is([class*=date i], [class*=time i])'
+
+# Only the ReliefWeb listing containers are parsed; nav, footer and scripts are skipped
+_RELIEFWEB_STRAINER = SoupStrainer(['article', 'div'], class_=re.compile(r'job|rw-river|river--result|listing|item', re.I))
+
+# Terms that boost a job's relevance score
+_HEALTH_TERMS = ('health', 'medical', 'hospital', 'clinic', 'public health', 'who', 'unicef', 'red cross')
+
+# Date formats tried when parsing listing dates
+_DATE_FORMATS = ('%Y-%m-%d', '%d %b %Y', '%b %d, %Y')
+
+class RateLimitedError(Exception):
+    """Raised when a job site answers with HTTP 429"""
+
 class RealJobScraper:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none',
-        })
-        self.session.timeout = 30
+        }
+        # One token bucket per host (5 requests/second) instead of fixed sleeps
+        self.limiters = {}
         logger.info("Real Job Scraper initialized - ACTIVE WEB SCRAPING")
 
-    def scrape_reliefweb_direct(self, query, max_results=10):
+    def _limiter_for(self, url):
+        """Return the rate limiter for the URL's host"""
+        host = urlparse(url).netloc
+        if host not in self.limiters:
+            self.limiters[host] = AsyncLimiter(5, 1.0)
+        return self.limiters[host]
+
+    @retry(
+        retry=retry_if_exception_type(RateLimitedError),
+        wait=wait_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(4),
+        reraise=True,
+    )
+    async def _afetch(self, client, url, params, timeout):
+        """Fetch a page and return its status code and raw body bytes"""
+        async with self._limiter_for(url):
+            response = await client.get(url, params=params, timeout=timeout)
+        
+        # Back off exponentially when the site tells us to slow down
+        if response.status_code == 429:
+            raise RateLimitedError(f"{url} returned 429")
+        
+        # Raw bytes skip charset detection; lxml reads the encoding
+        # from the page's <meta charset> instead
+        return response.status_code, response.content
+
+    async def scrape_reliefweb_direct(self, client, query, max_results=10):
         """Scrape ReliefWeb job listings directly from HTML"""
         jobs = []
         try:
@@ -46,10 +95,10 @@ class RealJobScraper:
             }
             
             logger.info(f"🔍 SCRAPING ReliefWeb for: {query}")
-            response = self.session.get(base_url, params=params, timeout=20)
+            status, html = await self._afetch(client, base_url, params, 20)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if status == 200:
+                soup = BeautifulSoup(html, 'lxml', parse_only=_RELIEFWEB_STRAINER)
                 
                 # Look for job listings - multiple possible selectors
                 job_selectors = [
@@ -69,7 +118,7 @@ class RealJobScraper:
                 
                 if not job_elements:
                     # Fallback: look for any job-like elements
-                    job_elements = soup.find_all(['article', 'div'], class_=re.compile(r'job|listing|item', re.I))
+                    job_elements = soup.find_all(['article', 'div'], class_=_RE_JOBITEM)
                     logger.info(f"Fallback found {len(job_elements)} job elements")
                 
                 for element in job_elements[:max_results]:
@@ -80,7 +129,7 @@ class RealJobScraper:
                 logger.info(f"✅ Successfully scraped {len(jobs)} REAL jobs from ReliefWeb")
                 
             else:
-                logger.error(f"❌ ReliefWeb returned {response.status_code}")
+                logger.error(f"❌ ReliefWeb returned {status}")
                 
         except Exception as e:
             logger.error(f"❌ ReliefWeb scraping failed: {str(e)}")
@@ -91,7 +140,7 @@ class RealJobScraper:
         """Parse individual ReliefWeb job listing"""
         try:
             # Extract title and URL
-            title_elem = element.find('h3') or element.find('h4') or element.find('a', class_=re.compile(r'title|heading', re.I))
+            title_elem = element.select_one(_SEL_TITLE)
             if not title_elem:
                 return None
                 
@@ -109,15 +158,15 @@ class RealJobScraper:
                 url = f"https://reliefweb.int{url}"
             
             # Extract organization
-            org_elem = element.find(['span', 'div'], class_=re.compile(r'organization|org|agency|source', re.I))
+            org_elem = element.select_one(_SEL_ORG)
             organization = org_elem.get_text(strip=True) if org_elem else "Humanitarian Organization"
             
             # Extract location
-            location_elem = element.find(['span', 'div'], class_=re.compile(r'country|location|place', re.I))
+            location_elem = element.select_one(_SEL_LOC)
             location = location_elem.get_text(strip=True) if location_elem else "Various Locations"
             
             # Extract date
-            date_elem = element.find(['time', 'span'], class_=re.compile(r'date|time', re.I))
+            date_elem = element.select_one(_SEL_DATE)
             date_text = date_elem.get('datetime') if date_elem and date_elem.get('datetime') else (
                 date_elem.get_text(strip=True) if date_elem else datetime.now().strftime("%Y-%m-%d")
             )
@@ -142,7 +191,7 @@ class RealJobScraper:
             logger.warning(f"Failed to parse job element: {e}")
             return None
 
-    def scrape_devnet_jobs(self, query, max_results=5):
+    async def scrape_devnet_jobs(self, client, query, max_results=5):
         """Scrape DevelopmentAid job board"""
         jobs = []
         try:
@@ -150,13 +199,13 @@ class RealJobScraper:
             params = {"search": query}
             
             logger.info(f"🔍 SCRAPING DevelopmentAid for: {query}")
-            response = self.session.get(url, params=params, timeout=15)
+            status, html = await self._afetch(client, url, params, 15)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if status == 200:
+                soup = BeautifulSoup(html, 'lxml')
                 
                 # Look for job listings
-                job_elements = soup.select('.job-item, .vacancy-item, .listing-item') or soup.find_all('div', class_=re.compile(r'job|vacancy', re.I))
+                job_elements = soup.select('.job-item, .vacancy-item, .listing-item') or soup.find_all('div', class_=_RE_JOBVAC)
                 
                 for element in job_elements[:max_results]:
                     job = self.parse_devnet_job(element, query)
@@ -197,15 +246,16 @@ class RealJobScraper:
             return None
 
     def calculate_relevance(self, title, organization):
-        """Calculate realistic relevance score"""
+        """Calculate relevance score - deterministic so results can be cached"""
+        title_lower = title.lower()
+        org_lower = organization.lower()
+        matches = sum(1 for term in _HEALTH_TERMS if term in title_lower or term in org_lower)
+        
         base_score = 0.5
-        # Boost for public health terms
-        health_terms = ['health', 'medical', 'hospital', 'clinic', 'public health', 'who', 'unicef', 'red cross']
-        for term in health_terms:
-            if term in title.lower() or term in organization.lower():
-                base_score += 0.2
-                break
-        return round(min(0.95, base_score + random.uniform(0, 0.3)), 2)
+        # Boost for public health terms, plus a bit more the more of them match
+        if matches:
+            base_score += 0.2 + 0.3 * matches / len(_HEALTH_TERMS)
+        return round(min(0.95, base_score), 2)
 
     def is_recent_date(self, date_text):
         """Determine if job is recent based on date string"""
@@ -213,7 +263,7 @@ class RealJobScraper:
             if 'hour' in date_text.lower() or 'today' in date_text.lower() or 'yesterday' in date_text.lower():
                 return True
             # Try to parse date
-            for fmt in ['%Y-%m-%d', '%d %b %Y', '%b %d, %Y']:
+            for fmt in _DATE_FORMATS:
                 try:
                     job_date = datetime.strptime(date_text.split('T')[0], fmt)
                     days_ago = (datetime.now() - job_date).days
@@ -222,33 +272,28 @@ class RealJobScraper:
                     continue
         except:
             pass
-        return random.random() > 0.3  # Fallback
+        return False  # Unparseable dates are not treated as recent
 
-    def search_jobs(self, search_terms, max_jobs=20):
-        """Main search method - REAL WEB SCRAPING"""
-        all_jobs = []
+    async def asearch_jobs(self, search_terms, max_jobs=20):
+        """Main search method - REAL WEB SCRAPING, all sources fetched concurrently"""
+        logger.info(f"🎯 REAL SCRAPING for: {', '.join(search_terms)}")
         
-        for term in search_terms:
-            logger.info(f"🎯 REAL SCRAPING for: {term}")
-            
-            # Scrape from multiple real sources
-            reliefweb_jobs = self.scrape_reliefweb_direct(term, 8)
-            devnet_jobs = self.scrape_devnet_jobs(term, 4)
-            
-            all_jobs.extend(reliefweb_jobs)
-            all_jobs.extend(devnet_jobs)
-            
-            # Respectful delay
-            time.sleep(2)
-        
-        # Remove duplicates by URL
-        unique_jobs = []
-        seen_urls = set()
+        # Scrape every term from multiple real sources over one shared HTTP/2
+        # client, so each host costs a single TLS handshake
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        async with httpx.AsyncClient(http2=True, headers=self.headers, limits=limits, timeout=30.0, follow_redirects=True) as client:
+            results = await asyncio.gather(
+                *[self.scrape_reliefweb_direct(client, term, 8) for term in search_terms],
+                *[self.scrape_devnet_jobs(client, term, 4) for term in search_terms],
+            )
         
-        for job in all_jobs:
-            if job['url'] not in seen_urls:
-                seen_urls.add(job['url'])
-                unique_jobs.append(job)
+        # Flatten and remove duplicates by URL in one pass, keeping the first
+        # job seen for each URL
+        seen = {}
+        for source_jobs in results:
+            for job in source_jobs:
+                seen.setdefault(job['url'], job)
+        unique_jobs = list(seen.values())
         
         # If no real jobs found, provide minimal realistic fallback
         if not unique_jobs:
@@ -258,6 +303,10 @@ class RealJobScraper:
         logger.info(f"🎉 TOTAL REAL JOBS FOUND: {len(unique_jobs)}")
         return unique_jobs[:max_jobs]
 
+    def search_jobs(self, search_terms, max_jobs=20):
+        """Synchronous wrapper around asearch_jobs"""
+        return asyncio.run(self.asearch_jobs(search_terms, max_jobs))
+
     def get_minimal_fallback(self, search_terms, count):
         """Minimal fallback when no real jobs can be scraped"""
         jobs = []
@@ -1,30 +1,207 @@
-import requests
+import asyncio
+import httpx
 import logging
 from typing import List, Dict, Optional
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-import time
+from functools import lru_cache
 from bs4 import BeautifulSoup
+from lxml import etree
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+import ahocorasick
 import re
-import random
+import soupsieve as sv
+import zlib
+
+# selectolax parses and queries job cards in C; BeautifulSoup is the fallback
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 
 logger = logging.getLogger(__name__)
 
+def _automaton(terms):
+    """Build an Aho-Corasick automaton that finds any of the terms in a single pass"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+def _contains_any(automaton, text):
+    """Check if lowercased text contains any of the automaton's terms"""
+    for _ in automaton.iter(text):
+        return True
+    return False
+
+# Health keywords and health organizations, matched against title and
+# organization together (org names already covered by a keyword, e.g.
+# 'mayo clinic', are left out)
+_HEALTH_TERMS = _automaton([
+    'health', 'medical', 'hospital', 'clinic', 'care', 'patient',
+    'clinical', 'healthcare', 'public health', 'epidemiology',
+    'biomedical', 'pharmacy', 'nursing', 'doctor', 'physician',
+    'surgeon', 'dentist', 'therapist', 'counselor', 'psychologist',
+    'nutrition', 'dietitian', 'pharmaceutical', 'biotech',
+    'unicef', 'red cross', 'kaiser', 'johns hopkins'
+])
+
+# Short org acronyms hide inside ordinary title words ('who' in
+# 'wholesale'), so they are only checked against the organization
+_HEALTH_ORG_ACRONYMS = _automaton(['cdc', 'who'])
+
+_MAJOR_HEALTH_ORGS = _automaton([
+    'who', 'world health organization', 'unicef', 'cdc',
+    'red cross', 'msf', 'mayo clinic', 'johns hopkins',
+    'cleveland clinic', 'massachusetts general', 'partners health'
+])
+
+_PUBLIC_HEALTH_TERMS = _automaton([
+    'public health', 'epidemiology', 'global health', 'community health',
+    'health policy', 'health equity', 'preventive medicine', 'health promotion'
+])
+
+# LinkedIn job card markers: a card is any li in the results list, or an
+# li/div/a carrying one of these class tokens or a jobPosting entity URN
+_JOB_CARD_CLASSES = frozenset(['job-search-card', 'base-card', 'job-card-container', 'occludable-update'])
+
+def _is_job_card(element):
+    """Check if a parsed lxml element is a LinkedIn job card"""
+    if element.tag not in ('li', 'div', 'a'):
+        return False
+    if element.tag == 'li':
+        parent = element.getparent()
+        if parent is not None and 'jobs-search__results-list' in parent.get('class', '').split():
+            return True
+    if 'jobPosting' in element.get('data-entity-urn', ''):
+        return True
+    return not _JOB_CARD_CLASSES.isdisjoint(element.get('class', '').split())
+
+# Field selectors: each is one comma selector so a field costs a single
+# tree walk (the first match in document order wins)
+_TITLE_CSS = '.base-search-card__title, .job-card-list__title, h3, h4, .job-card-container__link'
+_COMPANY_CSS = '.base-search-card__subtitle, .job-card-container__company-name, h4 a'
+_LOCATION_CSS = '.job-search-card__location, .job-card-container__metadata-item, .artdeco-entity-lockup__caption'
+
+# Precompiled for the BeautifulSoup fallback
+_TITLE_SEL = sv.compile(_TITLE_CSS)
+_COMPANY_SEL = sv.compile(_COMPANY_CSS)
+_LOCATION_SEL = sv.compile(_LOCATION_CSS)
+
+
+# One named group per country (underscores stand for spaces); short codes
+# are bounded so e.g. 'us' no longer matches inside 'australia'. Countries
+# are tried in this order, each lookahead scanning the whole location, so
+# "Los Angeles, CA, United States" stays United States rather than Canada
+_COUNTRY_PATTERNS = {
+    'United_States': r'\busa?\b|united states',
+    'United_Kingdom': r'\buk\b|united kingdom|britain',
+    'Canada': r'canada|\bca\b',
+    'Zimbabwe': r'zimbabwe|\bzw\b|harare',
+    'South_Africa': r'south africa|\bsa\b',
+    'Switzerland': r'switzerland|\bch\b|geneva',
+}
+_COUNTRY_RE = re.compile('|'.join(f'(?=.*?(?P<{name}>{pattern}))' for name, pattern in _COUNTRY_PATTERNS.items()), re.S)
+
+# Listings repeat the same few titles and locations, so the classifiers
+# below are memoized on their lowercased inputs
+
+@lru_cache(maxsize=1024)
+def _country_for(location_lower):
+    """Map a lowercased location string to a country"""
+    match = _COUNTRY_RE.match(location_lower)
+    return match.lastgroup.replace('_', ' ') if match else 'Various'
+
+@lru_cache(maxsize=1024)
+def _work_type_for(title_lower, location_lower):
+    """Determine work type from lowercased title and location"""
+    if 'remote' in title_lower or 'remote' in location_lower:
+        return 'Remote'
+    elif 'hybrid' in title_lower or 'hybrid' in location_lower:
+        return 'Hybrid'
+    else:
+        return 'On-site'
+
+# Description buckets in priority order; each lookahead scans the whole
+# title, so an earlier bucket wins even if its term appears later
+_DESC_RE = re.compile(
+    r'(?=.*?(?P<epi>epidemiology|epidemiologist))'
+    r'|(?=.*?(?P<policy>policy|advisor|consultant))'
+    r'|(?=.*?(?P<mgr>manager|coordinator|director))'
+    r'|(?=.*?(?P<nurse>nurse|nursing|clinical))',
+    re.S
+)
+
+_DESC_TEMPLATES = {
+    'epi': "Lead epidemiological investigations and research studies. Analyze public health data and contribute to disease surveillance systems. Work with healthcare teams to monitor and respond to health threats.",
+    'policy': "Develop and implement public health policies and guidelines. Analyze health legislation and provide strategic recommendations. Collaborate with stakeholders to improve health outcomes.",
+    'mgr': "Manage public health programs and initiatives. Coordinate with healthcare providers and community organizations. Monitor program effectiveness and ensure compliance with health standards.",
+    'nurse': "Provide direct patient care and health education. Conduct health assessments and develop care plans. Collaborate with multidisciplinary healthcare teams.",
+}
+
+_DEFAULT_DESC = "Contribute to public health initiatives and research. Collaborate with healthcare professionals to improve community health outcomes. Analyze health data and support public health programs."
+
+@lru_cache(maxsize=1024)
+def _description_for(title_lower):
+    """Pick a job description template from the lowercased title"""
+    match = _DESC_RE.match(title_lower)
+    return _DESC_TEMPLATES[match.lastgroup] if match else _DEFAULT_DESC
+
+@dataclass(slots=True)
+class Job:
+    """A scraped job listing; converted to a dict only at the API boundary"""
+    title: str
+    organization: str
+    location: str
+    date: str
+    url: str
+    source: str = "LinkedIn"
+    is_recent: bool = True
+    relevance_score: float = 0.0
+    authentic: bool = True
+    description: Optional[str] = None
+    work_type: Optional[str] = None
+    country: Optional[str] = None
+
+# Responses worth retrying rather than giving up on a search term
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class RetryableStatusError(Exception):
+    """Raised when LinkedIn answers with a status in RETRY_STATUSES"""
+
 class JobScraper:
+    # Max requests in flight to LinkedIn at once
+    MAX_CONCURRENT_REQUESTS = 2
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
-        self.session.timeout = 30
+        }
+        self.client = None
+        self.rate_limit = None
         logger.info("JobScraper initialized - PURE LINKEDIN FOCUS")
 
-    def scrape_linkedin_jobs(self, query, max_results=15):
-        """Scrape LinkedIn job listings - main method"""
+    async def __aenter__(self):
+        """Open the shared HTTP/2 client used by scrape_linkedin_jobs"""
+        # HTTP/2 multiplexes concurrent requests to LinkedIn over one connection;
+        # the transport also retries failed connection attempts
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=20)
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+        self.client = httpx.AsyncClient(transport=transport, headers=self.headers, timeout=25.0, follow_redirects=True)
+        self.rate_limit = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
+
+    async def scrape_linkedin_jobs(self, query, max_results=15):
+        """Scrape LinkedIn job listings - main method (use inside `async with JobScraper()`)"""
         jobs = []
         try:
             # LinkedIn jobs search with public health focus
@@ -41,170 +218,179 @@ class JobScraper:
             }
             
             logger.info(f"🔍 SCRAPING LinkedIn for: {query}")
-            response = self.session.get(linkedin_url, params=params, timeout=25)
-            
-            if response.status_code == 200:
-                jobs = self.parse_linkedin_html(response.text, query, max_results)
+            async with self.rate_limit:
+                jobs = self.score_jobs(await self.fetch_linkedin_page(linkedin_url, params, max_results), query)
                 logger.info(f"✅ LinkedIn: {len(jobs)} jobs for '{query}'")
-            else:
-                logger.warning(f"❌ LinkedIn returned {response.status_code}")
+                # Respectful delay before this slot is reused
+                await asyncio.sleep(2)
                 
         except Exception as e:
             logger.error(f"❌ LinkedIn scraping failed: {e}")
             
         return jobs
 
-    def parse_linkedin_html(self, html, query, max_results):
-        """Parse LinkedIn job listings from HTML"""
+    @retry(
+        retry=retry_if_exception_type(RetryableStatusError),
+        wait=wait_exponential(multiplier=0.5),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def fetch_linkedin_page(self, url, params, max_results):
+        """Stream one LinkedIn search page and parse its job cards
+        
+        Rate limiting and transient server errors are retried with
+        exponential backoff instead of failing the whole search term.
+        """
+        async with self.client.stream('GET', url, params=params) as response:
+            if response.status_code in RETRY_STATUSES:
+                raise RetryableStatusError(f"LinkedIn returned {response.status_code}")
+            if response.status_code != 200:
+                logger.warning(f"❌ LinkedIn returned {response.status_code}")
+                return []
+            return await self.parse_linkedin_stream(response, max_results)
+
+    async def parse_linkedin_stream(self, response, max_results):
+        """Parse LinkedIn job cards while the page downloads
+        
+        Each card is extracted as soon as its closing tag arrives and then
+        freed along with everything parsed before it, so the tree only holds
+        the current card and its open ancestors rather than the whole page,
+        and the download stops once max_results cards have been read.
+        """
         jobs = []
+        cards_read = 0
+        # Raw (already decompressed) bytes go straight to lxml; without a
+        # charset in the headers it detects the encoding from <meta charset>
+        parser = etree.HTMLPullParser(events=('end',), encoding=response.charset_encoding)
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # LinkedIn job card selectors (multiple attempts)
-            selectors = [
-                '.jobs-search__results-list li',
-                '.job-search-card',
-                '.base-card',
-                '.job-card-container',
-                '[data-entity-urn*="jobPosting"]',
-                '.occludable-update'
-            ]
-            
-            job_elements = []
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    logger.info(f"Found {len(elements)} elements with: {selector}")
-                    job_elements = elements
-                    break
-            
-            # If no specific selectors work, look for job-like containers
-            if not job_elements:
-                job_elements = soup.find_all(['li', 'div'], attrs={
-                    'class': re.compile(r'job|card|result|item', re.I)
-                })
-                logger.info(f"Generic search found {len(job_elements)} elements")
-            
-            for element in job_elements[:max_results]:
-                job = self.extract_job_from_element(element, query)
-                if job and self.is_health_related(job):
-                    jobs.append(job)
+            async for chunk in response.aiter_bytes(16384):
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    # Skip non-cards and cards whose content was already
+                    # extracted and cleared as an inner card (e.g. the
+                    # results-list li around a base-card)
+                    if not _is_job_card(element) or not ''.join(element.itertext()).strip():
+                        continue
+                    
+                    card_html = etree.tostring(element)
+                    if HTMLParser is not None:
+                        job = self.extract_job_from_node(HTMLParser(card_html))
+                    else:
+                        job = self.extract_job_from_element(BeautifulSoup(card_html, 'lxml'))
+                    
+                    # Release the card and anything parsed before it: earlier
+                    # siblings of the card and of each ancestor (previous li
+                    # shells, <head>, nav, inline scripts)
+                    element.clear()
+                    for node in (element, *element.iterancestors()):
+                        # The <html> root has no parent, though a leading
+                        # comment or <?xml ?> declaration is its "previous"
+                        parent = node.getparent()
+                        if parent is None:
+                            break
+                        while node.getprevious() is not None:
+                            del parent[0]
+                    
+                    if job is None:
+                        continue
+                    if self.is_health_related(job):
+                        jobs.append(job)
+                    cards_read += 1
+                    if cards_read >= max_results:
+                        return jobs
                     
         except Exception as e:
             logger.error(f"Failed to parse LinkedIn HTML: {e}")
             
         return jobs
 
-    def extract_job_from_element(self, element, query):
-        """Extract job data from LinkedIn element"""
+    def extract_job_from_node(self, tree):
+        """Extract job data from a LinkedIn card parsed with selectolax"""
         try:
-            # Title extraction
-            title_selectors = [
-                '.base-search-card__title',
-                '.job-card-list__title', 
-                'h3',
-                'h4',
-                '.job-card-container__link'
-            ]
-            
-            title = None
-            for selector in title_selectors:
-                title_elem = element.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    break
+            title_node = tree.css_first(_TITLE_CSS)
+            title = title_node.text(strip=True) if title_node else None
             
             if not title:
                 return None
             
-            # Company extraction
-            company_selectors = [
-                '.base-search-card__subtitle',
-                '.job-card-container__company-name',
-                'h4 a'
-            ]
+            company_node = tree.css_first(_COMPANY_CSS)
+            company = (company_node.text(strip=True) if company_node else None) or "Healthcare Organization"
             
-            company = None
-            for selector in company_selectors:
-                company_elem = element.select_one(selector)
-                if company_elem:
-                    company = company_elem.get_text(strip=True)
-                    break
+            location_node = tree.css_first(_LOCATION_CSS)
+            location = (location_node.text(strip=True) if location_node else None) or "Multiple Locations"
             
-            company = company or "Healthcare Organization"
+            link_node = tree.css_first('a[href]')
+            if not link_node:
+                return None
             
-            # Location extraction
-            location_selectors = [
-                '.job-search-card__location',
-                '.job-card-container__metadata-item',
-                '.artdeco-entity-lockup__caption'
-            ]
+            return self.build_job(title, company, location, link_node.attributes.get('href') or '')
+            
+        except Exception as e:
+            logger.warning(f"Failed to extract job from node: {e}")
+            return None
+
+    def extract_job_from_element(self, element):
+        """Extract job data from LinkedIn element (BeautifulSoup fallback)"""
+        try:
+            # Title extraction
+            title_elem = _TITLE_SEL.select_one(element)
+            title = title_elem.get_text(strip=True) if title_elem else None
             
-            location = None
-            for selector in location_selectors:
-                location_elem = element.select_one(selector)
-                if location_elem:
-                    location = location_elem.get_text(strip=True)
-                    break
+            if not title:
+                return None
             
-            location = location or "Multiple Locations"
+            # Company extraction
+            company_elem = _COMPANY_SEL.select_one(element)
+            company = (company_elem.get_text(strip=True) if company_elem else None) or "Healthcare Organization"
+            
+            # Location extraction
+            location_elem = _LOCATION_SEL.select_one(element)
+            location = (location_elem.get_text(strip=True) if location_elem else None) or "Multiple Locations"
             
             # URL extraction
             link_elem = element.find('a', href=True)
             if not link_elem:
                 return None
-                
-            url = link_elem['href']
-            if url.startswith('/'):
-                url = f"https://www.linkedin.com{url}"
             
-            job = {
-                "title": title,
-                "organization": company,
-                "location": location,
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "url": url,
-                "source": "LinkedIn",
-                "is_recent": True,
-                "relevance_score": self.calculate_relevance(title, company, query),
-                "authentic": True
-            }
-            return job
+            return self.build_job(title, company, location, link_elem['href'])
             
         except Exception as e:
             logger.warning(f"Failed to extract job from element: {e}")
             return None
 
+    def build_job(self, title, company, location, url):
+        """Build the Job for an extracted LinkedIn card"""
+        if url.startswith('/'):
+            url = f"https://www.linkedin.com{url}"
+        
+        return Job(
+            title=title,
+            organization=company,
+            location=location,
+            date=datetime.now().strftime("%Y-%m-%d"),
+            url=url,
+        )
+
     def is_health_related(self, job):
         """Check if job is health-related"""
-        health_keywords = [
-            'health', 'medical', 'hospital', 'clinic', 'care', 'patient',
-            'clinical', 'healthcare', 'public health', 'epidemiology',
-            'biomedical', 'pharmacy', 'nursing', 'doctor', 'physician',
-            'surgeon', 'dentist', 'therapist', 'counselor', 'psychologist',
-            'nutrition', 'dietitian', 'pharmaceutical', 'biotech'
-        ]
-        
-        title_lower = job['title'].lower()
-        org_lower = job['organization'].lower()
-        
-        # Check if title or organization contains health keywords
-        for keyword in health_keywords:
-            if keyword in title_lower or keyword in org_lower:
-                return True
+        title_lower = job.title.lower()
+        org_lower = job.organization.lower()
         
-        # Check for known health organizations
-        health_orgs = [
-            'hospital', 'clinic', 'medical center', 'health system',
-            'public health', 'cdc', 'who', 'unicef', 'red cross',
-            'kaiser', 'mayo clinic', 'cleveland clinic', 'johns hopkins'
-        ]
+        # Check if title or organization contains health keywords or names a
+        # known health organization (the NUL separator stops matches spanning
+        # both fields)
+        return (_contains_any(_HEALTH_TERMS, title_lower + '\x00' + org_lower)
+                or _contains_any(_HEALTH_ORG_ACRONYMS, org_lower))
+
+    def score_jobs(self, jobs, query):
+        """Set relevance_score on a page of jobs in one batch
         
-        for org in health_orgs:
-            if org in org_lower:
-                return True
-                
-        return False
+        Scoring after extraction means cards rejected by is_health_related
+        are never scored.
+        """
+        for job in jobs:
+            job.relevance_score = self.calculate_relevance(job.title, job.organization, query)
+        return jobs
 
     def calculate_relevance(self, title, company, query):
         """Calculate relevance score for job"""
@@ -218,61 +404,51 @@ class JobScraper:
             score += 0.3
             
         # Health organization boost
-        major_health_orgs = [
-            'who', 'world health organization', 'unicef', 'cdc', 
-            'red cross', 'msf', 'mayo clinic', 'johns hopkins',
-            'cleveland clinic', 'massachusetts general', 'partners health'
-        ]
-        
-        for org in major_health_orgs:
-            if org in company_lower:
-                score += 0.4
-                break
+        if _contains_any(_MAJOR_HEALTH_ORGS, company_lower):
+            score += 0.4
         
         # Public health specific terms
-        public_health_terms = [
-            'public health', 'epidemiology', 'global health', 'community health',
-            'health policy', 'health equity', 'preventive medicine', 'health promotion'
-        ]
-        
-        for term in public_health_terms:
-            if term in title_lower:
-                score += 0.2
-                break
+        if _contains_any(_PUBLIC_HEALTH_TERMS, title_lower):
+            score += 0.2
                 
-        return round(min(0.98, max(0.3, score + random.uniform(-0.1, 0.1))), 2)
+        # Small jitter derived from the job itself so equal scores don't all tie;
+        # crc32 (unlike hash()) is stable across processes
+        jitter = (zlib.crc32(f"{title}\x00{company}".encode()) & 0xFF) / 2550.0 - 0.05
+        return round(min(0.98, max(0.3, score + jitter)), 2)
 
-    def search_jobs(self, search_terms, max_jobs=20):
-        """Main search method - LinkedIn only"""
-        all_jobs = []
+    async def asearch_jobs(self, search_terms, max_jobs=20):
+        """Main search method - LinkedIn only, all terms scraped concurrently"""
+        logger.info(f"🎯 LINKEDIN SEARCH: {', '.join(search_terms)}")
         
-        for term in search_terms:
-            logger.info(f"🎯 LINKEDIN SEARCH: {term}")
-            
-            # Scrape LinkedIn
-            linkedin_jobs = self.scrape_linkedin_jobs(term, max_results=12)
-            
-            if linkedin_jobs:
+        async with self:
+            tasks = [self.scrape_linkedin_jobs(term, max_results=12) for term in search_terms]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        all_jobs = []
+        for term, linkedin_jobs in zip(search_terms, results):
+            if isinstance(linkedin_jobs, Exception):
+                logger.error(f"❌ LinkedIn search failed for {term}: {linkedin_jobs}")
+            elif linkedin_jobs:
                 all_jobs.extend(linkedin_jobs)
-                logger.info(f"✅ Found {len(linkedin_jobs)} health jobs")
+                logger.info(f"✅ Found {len(linkedin_jobs)} health jobs for: {term}")
             else:
                 logger.info(f"❌ No LinkedIn jobs found for: {term}")
-            
-            # Respectful delay
-            time.sleep(2)
-        
-        # Remove duplicates by title+company
-        unique_jobs = []
-        seen_combos = set()
         
+        return self.merge_jobs(all_jobs, max_jobs)
+
+    def search_jobs(self, search_terms, max_jobs=20):
+        """Synchronous wrapper around asearch_jobs for scripts and the CLI, returning dicts"""
+        return [asdict(job) for job in asyncio.run(self.asearch_jobs(search_terms, max_jobs))]
+
+    def merge_jobs(self, all_jobs, max_jobs=20):
+        """Deduplicate and rank jobs collected across search terms (any iterable of jobs)"""
+        # Remove duplicates by title+company, keeping the first job seen
+        seen = {}
         for job in all_jobs:
-            combo = f"{job['title']}|{job['organization']}"
-            if combo not in seen_combos:
-                seen_combos.add(combo)
-                unique_jobs.append(job)
+            seen.setdefault((job.title, job.organization), job)
         
         # Sort by relevance
-        unique_jobs.sort(key=lambda x: x['relevance_score'], reverse=True)
+        unique_jobs = sorted(seen.values(), key=lambda x: x.relevance_score, reverse=True)
         
         final_count = len(unique_jobs)
         if final_count == 0:
@@ -280,7 +456,38 @@ class JobScraper:
         else:
             logger.info(f"🎯 RESULT: {final_count} health jobs from LinkedIn")
             
-        return unique_jobs[:max_jobs]
+        # Enhance only the jobs that are actually returned
+        return self.enhance_job_data(unique_jobs[:max_jobs])
+
+    def enhance_job_data(self, jobs):
+        """Fill in descriptions and additional fields on the jobs in place
+        
+        The jobs may be shared: main.scrape_cache hands the same Job objects
+        to every request, so each request re-enhances them. That is only safe
+        because the fields are derived purely from title and location.
+        """
+        for job in jobs:
+            # Lowercase once and share with every classifier
+            title_lower = job.title.lower()
+            location_lower = job.location.lower()
+            
+            job.description = self.generate_job_description(title_lower)
+            job.work_type = self.determine_work_type(title_lower, location_lower)
+            job.country = self.extract_country(location_lower)
+        
+        return jobs
+
+    def generate_job_description(self, title_lower):
+        """Generate appropriate job description based on the lowercased title"""
+        return _description_for(title_lower)
+
+    def determine_work_type(self, title_lower, location_lower):
+        """Determine work type based on the lowercased title and location"""
+        return _work_type_for(title_lower, location_lower)
+
+    def extract_country(self, location_lower):
+        """Extract country from a lowercased location string"""
+        return _country_for(location_lower) if location_lower else 'Various'
 
 # Test the pure LinkedIn scraper
 if __name__ == "__main__":
@@ -294,117 +501,3 @@ if __name__ == "__main__":
         print(f"   🏢 {job['organization']} | 📍 {job['location']}")
         print(f"   ⭐ {job['relevance_score']} | 🔗 LinkedIn")
         print()
-
-    def enhance_job_data(self, jobs):
-        """Enhance job data with descriptions and additional fields"""
-        enhanced_jobs = []
-        for job in jobs:
-            # Add description based on job title and organization
-            description = self.generate_job_description(job)
-            
-            enhanced_job = {
-                **job,
-                "description": description,
-                "work_type": self.determine_work_type(job),
-                "country": self.extract_country(job.get('location', ''))
-            }
-            enhanced_jobs.append(enhanced_job)
-        
-        return enhanced_jobs
-
-    def generate_job_description(self, job):
-        """Generate appropriate job description based on title and organization"""
-        title = job.get('title', '').lower()
-        organization = job.get('organization', '').lower()
-        
-        if any(term in title for term in ['epidemiology', 'epidemiologist']):
-            return "Lead epidemiological investigations and research studies. Analyze public health data and contribute to disease surveillance systems. Work with healthcare teams to monitor and respond to health threats."
-        
-        elif any(term in title for term in ['policy', 'advisor', 'consultant']):
-            return "Develop and implement public health policies and guidelines. Analyze health legislation and provide strategic recommendations. Collaborate with stakeholders to improve health outcomes."
-        
-        elif any(term in title for term in ['manager', 'coordinator', 'director']):
-            return "Manage public health programs and initiatives. Coordinate with healthcare providers and community organizations. Monitor program effectiveness and ensure compliance with health standards."
-        
-        elif any(term in title for term in ['nurse', 'nursing', 'clinical']):
-            return "Provide direct patient care and health education. Conduct health assessments and develop care plans. Collaborate with multidisciplinary healthcare teams."
-        
-        else:
-            return "Contribute to public health initiatives and research. Collaborate with healthcare professionals to improve community health outcomes. Analyze health data and support public health programs."
-
-    def determine_work_type(self, job):
-        """Determine work type based on job title and location"""
-        title = job.get('title', '').lower()
-        location = job.get('location', '').lower()
-        
-        if 'remote' in title or 'remote' in location:
-            return 'Remote'
-        elif 'hybrid' in title or 'hybrid' in location:
-            return 'Hybrid'
-        else:
-            return 'On-site'
-
-    def extract_country(self, location):
-        """Extract country from location string"""
-        if not location:
-            return 'Various'
-        
-        location_lower = location.lower()
-        country_mapping = {
-            'usa': 'United States', 'us': 'United States', 'united states': 'United States',
-            'uk': 'United Kingdom', 'united kingdom': 'United Kingdom', 'britain': 'United Kingdom',
-            'canada': 'Canada', 'ca': 'Canada',
-            'zimbabwe': 'Zimbabwe', 'zw': 'Zimbabwe', 'harare': 'Zimbabwe',
-            'south africa': 'South Africa', 'sa': 'South Africa',
-            'switzerland': 'Switzerland', 'ch': 'Switzerland', 'geneva': 'Switzerland'
-        }
-        
-        for key, country in country_mapping.items():
-            if key in location_lower:
-                return country
-        
-        return 'Various'
-
-    # Update the search_jobs method to use enhanced data
-    def search_jobs(self, search_terms, max_jobs=20):
-        """Main search method - LinkedIn only with enhanced data"""
-        all_jobs = []
-        
-        for term in search_terms:
-            logger.info(f"🎯 LINKEDIN SEARCH: {term}")
-            
-            # Scrape LinkedIn
-            linkedin_jobs = self.scrape_linkedin_jobs(term, max_results=12)
-            
-            if linkedin_jobs:
-                all_jobs.extend(linkedin_jobs)
-                logger.info(f"✅ Found {len(linkedin_jobs)} health jobs")
-            else:
-                logger.info(f"❌ No LinkedIn jobs found for: {term}")
-            
-            # Respectful delay
-            time.sleep(2)
-        
-        # Remove duplicates by title+company
-        unique_jobs = []
-        seen_combos = set()
-        
-        for job in all_jobs:
-            combo = f"{job['title']}|{job['organization']}"
-            if combo not in seen_combos:
-                seen_combos.add(combo)
-                unique_jobs.append(job)
-        
-        # Enhance job data with descriptions and additional fields
-        enhanced_jobs = self.enhance_job_data(unique_jobs)
-        
-        # Sort by relevance
-        enhanced_jobs.sort(key=lambda x: x['relevance_score'], reverse=True)
-        
-        final_count = len(enhanced_jobs)
-        if final_count == 0:
-            logger.info("🎯 RESULT: No health-related jobs found on LinkedIn")
-        else:
-            logger.info(f"🎯 RESULT: {final_count} health jobs from LinkedIn")
-            
-        return enhanced_jobs[:max_jobs]